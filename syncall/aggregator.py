@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from functools import partial
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
@@ -33,6 +34,7 @@ class Aggregator:
         resolution_strategy: ResolutionStrategy = AlwaysSecondRS(),
         config_fname: Optional[str] = None,
         ignore_keys: Tuple[Sequence[str], Sequence[str]] = tuple(),
+        concurrent_fetch: bool = False,
     ):
         # Preferences manager
         # Sample config path: ~/.config/syncall/taskwarrior_gcal_sync.yaml
@@ -84,10 +86,17 @@ class Aggregator:
         if correspondences_prefs_key not in self.prefs_manager:
             self.prefs_manager[correspondences_prefs_key] = bidict()
         self._B_to_A_map: bidict = self.prefs_manager[correspondences_prefs_key]
+        # item_synchronizer keeps both directions in sync via the bidict, keep a handle to the
+        # inverse view so that lookups on the A side don't go through `.inverse` every time
+        self._A_to_B_map: bidict = self._B_to_A_map.inverse
 
         # resolution strategy to resolve conflicts
         self._resolution_strategy = resolution_strategy
 
+        # fetch the items of the two sides concurrently - only for sides whose clients can be
+        # used from a worker thread
+        self._concurrent_fetch = concurrent_fetch
+
         # item synchronizer -------------------------------------------------------------------
         def side_B_fn(fn):
             wrapped = partial(fn, helper=self._helper_B)
@@ -100,7 +109,7 @@ class Aggregator:
             return wrapped
 
         self._synchronizer = Synchronizer(
-            A_to_B=self._B_to_A_map.inverse,
+            A_to_B=self._A_to_B_map,
             inserter_to_A=side_A_fn(self.inserter_to),
             inserter_to_B=side_B_fn(self.inserter_to),
             updater_to_A=side_A_fn(self.updater_to),
@@ -131,47 +140,42 @@ class Aggregator:
         """
         serdes_dir, _ = self._get_serdes_dirs(helper)
         logger.info(f"Detecting changes from {helper}...")
-        item_ids = set(items.keys())
+        item_ids = items.keys()
+        registered_ids = self._get_ids_map(helper=helper).keys()
         # New items exist in the sync side but don't yet exist in my IDs correspndences.
-        new = {
-            item_id for item_id in item_ids if item_id not in self._get_ids_map(helper=helper)
-        }
+        new = item_ids - registered_ids
         # Deleted items do not exist in the sync side but still yet exist in my IDs
         # correspndences.
-        #
-        # Exclude the already new ones determined in the earlier step
-        deleted = {
-            registered_id
-            for registered_id in self._get_ids_map(helper=helper)
-            if registered_id not in item_ids.difference(new)
-        }
+        deleted = registered_ids - item_ids
 
         # Potentially modified items are all the items that exist in the sync side minus the
-        # ones already determined as deleted or new
+        # ones already determined as deleted or new, i.e., the ones that exist in both.
         #
         # For these items, load the cached version and check whether they are the same or not
         # to actually determine the ones that are changed.
         modified = set()
-        potentially_modified_ids = item_ids.difference(new.union(deleted))
+        potentially_modified_ids = item_ids & registered_ids
+        side, _ = self._get_side_instances(helper)
+        ignore_keys = [helper.id_key, *helper.ignore_keys]
         for item_id in potentially_modified_ids:
             item = items[item_id]
             cached_item = pickle_load(serdes_dir / item_id)
-            if self._item_has_update(prev_item=cached_item, new_item=item, helper=helper):
+            if not side.items_are_identical(cached_item, item, ignore_keys=ignore_keys):
                 modified.add(item_id)
 
         side_changes = SideChanges(new=new, modified=modified, deleted=deleted)
-        logger.debug(f"\n\n{side_changes}")
+        logger.debug("\n\n{}", side_changes)
 
         return side_changes
 
     def sync(self):
         """Entrypoint method."""
-        items_A = {
-            str(item[self._helper_A.id_key]): item for item in self._side_A.get_all_items()
-        }
-        items_B = {
-            str(item[self._helper_B.id_key]): item for item in self._side_B.get_all_items()
-        }
+        all_items_A, all_items_B = self._fetch_all_items()
+
+        id_key_A = self._helper_A.id_key
+        id_key_B = self._helper_B.id_key
+        items_A = {str(item[id_key_A]): item for item in all_items_A}
+        items_B = {str(item[id_key_B]): item for item in all_items_B}
 
         # find what's changed in each side
         changes_A = self.detect_changes(self._helper_A, items_A)
@@ -198,6 +202,38 @@ class Aggregator:
         # synchronize
         self._synchronizer.sync(changes_A=changes_A, changes_B=changes_B)
 
+    def _fetch_all_items(self) -> Tuple[Sequence[Item], Sequence[Item]]:
+        """Fetch all the items of both sides.
+
+        If concurrent fetching is enabled, fetch the items of side A on a daemon thread while
+        fetching the items of side B on the calling thread. An error (or a KeyboardInterrupt)
+        while fetching side B propagates right away - the daemon thread is abandoned and
+        doesn't keep the process from exiting. An error while fetching side A is raised once
+        the items of side B have been fetched.
+        """
+        if not self._concurrent_fetch:
+            return self._side_A.get_all_items(), self._side_B.get_all_items()
+
+        result_A: Dict[str, Any] = {}
+
+        def fetch_A():
+            try:
+                result_A["items"] = self._side_A.get_all_items()
+            except BaseException as err:
+                result_A["error"] = err
+
+        thread_A = threading.Thread(
+            target=fetch_A, name=f"fetch-{self._side_A.name.lower()}", daemon=True
+        )
+        thread_A.start()
+        all_items_B = self._side_B.get_all_items()
+        thread_A.join()
+
+        if "error" in result_A:
+            raise result_A["error"]
+
+        return result_A["items"], all_items_B
+
     def start(self):
         """Initialization actions."""
         self._side_A.start()
@@ -257,16 +293,8 @@ class Aggregator:
         item = side.get_item(item_id)
         return item
 
-    def _item_has_update(self, prev_item: Item, new_item: Item, helper: SideHelper) -> bool:
-        """Determine whether the item has been updated."""
-        side, _ = self._get_side_instances(helper)
-
-        return not side.items_are_identical(
-            prev_item, new_item, ignore_keys=[helper.id_key, *helper.ignore_keys]
-        )
-
     def _get_ids_map(self, helper: SideHelper):
-        return self._B_to_A_map if helper is self._helper_B else self._B_to_A_map.inverse
+        return self._B_to_A_map if helper is self._helper_B else self._A_to_B_map
 
     def _get_serdes_dirs(self, helper: SideHelper) -> Tuple[Path, Path]:
         serdes_dir = self.config[f"{helper}_serdes"]
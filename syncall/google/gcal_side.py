@@ -37,6 +37,7 @@ class GCalSide(GoogleSide):
     ]
 
     _date_keys = ["end", "start", "updated"]
+    _event_time_keys = frozenset({"start", "end"})
     _date_format = "%Y-%m-%d"
 
     def __init__(
@@ -207,7 +208,7 @@ class GCalSide(GoogleSide):
 
         :param t: Time to query, 'start' or 'end'
         """
-        assert t in ["start", "end"]
+        assert t in GCalSide._event_time_keys
         assert t in item.keys(), "'end' key not found in item"
 
         # sometimes the google calendar api returns this as a datetime
@@ -204,6 +204,7 @@ def main(
                 (),
                 (),
             ),
+            concurrent_fetch=True,
         ) as aggregator:
             aggregator.sync()
     except KeyboardInterrupt:
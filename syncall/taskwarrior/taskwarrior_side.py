@@ -35,6 +35,8 @@ OrderByType = Literal[
 tw_duration_key = "twgcalsyncduration"
 tw_config_default_overrides = {"context": "none", f"uda.{tw_duration_key}.type": "duration"}
 
+_valid_statuses_on_add = frozenset({"pending", "done", "completed"})
+
 
 def parse_datetime_(dt: Union[str, datetime.datetime]) -> datetime.datetime:
     if isinstance(dt, datetime.datetime):
@@ -223,7 +225,7 @@ class TaskWarriorSide(SyncSide):
         ), "Item already has a UUID, try updating it instead of adding it"
 
         curr_status = item.get("status", None)
-        if curr_status not in ["pending", "done", "completed"]:
+        if curr_status not in _valid_statuses_on_add:
             logger.warning(f'Invalid status of task [{item["status"]}], setting it to pending')  # type: ignore
             item["status"] = "pending"
 
@@ -233,18 +235,15 @@ class TaskWarriorSide(SyncSide):
             item["project"] = self._project
 
         description = item.pop("description")
-        len_print = min(20, len(description))
-        logger.trace(f'Adding task "{description[0:len_print]}" with properties:\n\n{item}')
+        logger.trace('Adding task "{:.20}" with properties:\n\n{}', description, item)
         new_item = self._tw.task_add(description=description, **item)  # type: ignore
         new_id = new_item["id"]
-        logger.debug(f'Task "{new_id}" created - "{description[0:len_print]}"...')
+        logger.debug('Task "{}" created - "{:.20}"...', new_id, description)
 
         # explicitly mark as deleted - taskw doesn't like task_add(`status:deleted`) so we have
         # todo it in two steps
         if curr_status == "deleted":
-            logger.debug(
-                f'Task "{new_id}" marking as deleted - "{description[0:len_print]}"...'
-            )
+            logger.debug('Task "{}" marking as deleted - "{:.20}"...', new_id, description)
             self._tw.task_delete(id=new_id)
 
         return cast(ItemType, new_item)
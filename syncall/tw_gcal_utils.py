@@ -1,3 +1,4 @@
+import re
 import traceback
 from datetime import timedelta
 from typing import List, Optional, Tuple
@@ -17,6 +18,12 @@ _prefix_title_success_str = "✅"
 _prefix_title_failed_str = "❌"
 _failed_str = "FAIL"
 
+# "* <field>...: <value>" lines in the description of the GCal event
+_desc_field_re = re.compile(r"^\* (annotation|status|uuid)[^:]*:(.*)$", re.IGNORECASE)
+
+_required_tw_keys = frozenset({"description", "status", "uuid"})
+_valid_tw_statuses = frozenset({"pending", "completed", "deleted", "waiting", "recurring"})
+
 
 def _already_has_prefix(gcal_item: Item) -> bool:
     return gcal_item["summary"].startswith(_prefix_title_success_str) or gcal_item[
@@ -53,9 +60,7 @@ def convert_tw_to_gcal(
     .. note:: Do not convert the ID as that may change either manually or
               after marking the task as "DONE"
     """
-    assert all(
-        i in tw_item.keys() for i in ("description", "status", "uuid")
-    ), "Missing keys in tw_item"
+    assert _required_tw_keys <= tw_item.keys(), "Missing keys in tw_item"
 
     gcal_item = {}
 
@@ -65,20 +70,21 @@ def convert_tw_to_gcal(
         _add_task_prefix_if_not_present(gcal_item=gcal_item)
 
     # description
-    gcal_item["description"] = "IMPORTED FROM TASKWARRIOR\n"
-    if "annotations" in tw_item.keys():
-        for i, annotation in enumerate(tw_item["annotations"]):
-            gcal_item["description"] += f"\n* Annotation {i + 1}: {annotation}"
-
-    gcal_item["description"] += "\n"
-    for k in ["status", "uuid"]:
-        gcal_item["description"] += f"\n* {k}: {tw_item[k]}"
+    desc_parts = ["IMPORTED FROM TASKWARRIOR", ""]
+    desc_parts.extend(
+        f"* Annotation {i + 1}: {annotation}"
+        for i, annotation in enumerate(tw_item.get("annotations", ()))
+    )
+    desc_parts.append("")
+    desc_parts.extend(f"* {k}: {tw_item[k]}" for k in ("status", "uuid"))
+    gcal_item["description"] = "\n".join(desc_parts)
 
+    format_datetime = GCalSide.format_datetime
     date_keys = ["scheduled", "due"] if prefer_scheduled_date else ["due", "scheduled"]
     # event duration --------------------------------------------------------------------------
     # use the UDA field to fetch the duration of the event, otherwise fallback to the default
     # duration
-    if tw_duration_key in tw_item.keys():
+    if tw_duration_key in tw_item:
         duration: timedelta = taskw_duration_deserialize(tw_item[tw_duration_key])
         assert isinstance(duration, timedelta)
     else:
@@ -91,15 +97,13 @@ def convert_tw_to_gcal(
     # - if the scheduled key is not found, do the same with the due key if that's found
     # - if none of the above keys work, use the entry key: (start=entry, end=entry+1)
     for date_key in date_keys:
-        if date_key in tw_item.keys():
+        if date_key in tw_item:
             logger.trace(
                 f'Using "{date_key}" date for {tw_item["uuid"]} for setting the end date of'
                 " the event"
             )
-            dt_gcal = GCalSide.format_datetime(tw_item[date_key])
-            gcal_item["start"] = {
-                "dateTime": GCalSide.format_datetime(tw_item[date_key] - duration)
-            }
+            dt_gcal = format_datetime(tw_item[date_key])
+            gcal_item["start"] = {"dateTime": format_datetime(tw_item[date_key] - duration)}
             gcal_item["end"] = {"dateTime": dt_gcal}
             break
     else:
@@ -107,15 +111,15 @@ def convert_tw_to_gcal(
             f'Using "entry" date for {tw_item["uuid"]} for setting the start date of the event'
         )
         entry_dt = tw_item["entry"]
-        entry_dt_gcal_str = GCalSide.format_datetime(entry_dt)
+        entry_dt_gcal_str = format_datetime(entry_dt)
 
         gcal_item["start"] = {"dateTime": entry_dt_gcal_str}
 
-        gcal_item["end"] = {"dateTime": GCalSide.format_datetime(entry_dt + duration)}
+        gcal_item["end"] = {"dateTime": format_datetime(entry_dt + duration)}
 
     # update time
-    if "modified" in tw_item.keys():
-        gcal_item["updated"] = GCalSide.format_datetime(tw_item["modified"])
+    if "modified" in tw_item:
+        gcal_item["updated"] = format_datetime(tw_item["modified"])
 
     return gcal_item
 
@@ -145,7 +149,7 @@ def convert_gcal_to_tw(
         status = "completed"
 
     # Status
-    if status not in ["pending", "completed", "deleted", "waiting", "recurring"]:
+    if status not in _valid_tw_statuses:
         logger.error(
             "Invalid status {status} in GCal->TW conversion of item. Skipping status:"
         )
@@ -168,15 +172,16 @@ def convert_gcal_to_tw(
     else:
         date_key = "due"
 
-    end_time = GCalSide.get_event_time(gcal_item, t="end")
+    get_event_time = GCalSide.get_event_time
+    end_time = get_event_time(gcal_item, t="end")
     tw_item[date_key] = end_time
 
     # update time
-    if "updated" in gcal_item.keys():
+    if "updated" in gcal_item:
         tw_item["modified"] = GCalSide.parse_datetime(gcal_item["updated"])
 
     tw_item[tw_duration_key] = taskw_duration_serialize(
-        end_time - GCalSide.get_event_time(gcal_item, t="start")
+        end_time - get_event_time(gcal_item, t="start")
     )
 
     # Note:
@@ -196,39 +201,40 @@ def _parse_gcal_item_desc(
     status = "pending"
     uuid = None
 
-    if "description" not in gcal_item.keys():
+    if "description" not in gcal_item:
         return annotations, status, uuid
 
     gcal_desc = gcal_item["description"]
-    # strip whitespaces, empty lines
-    lines = [line.strip() for line in gcal_desc.split("\n") if line][1:]
-
-    # annotations
-    i = 0
-    for i, line in enumerate(lines):
-        parts = line.split(":", maxsplit=1)
-        if len(parts) == 2 and parts[0].lower().startswith("* annotation"):
-            annotations.append(parts[1].strip())
+    # strip whitespaces, empty lines - lazily, the lines are consumed in a single pass below
+    lines = (line.strip() for line in gcal_desc.split("\n") if line)
+    # skip the title line, e.g., "IMPORTED FROM TASKWARRIOR"
+    next(lines, None)
+
+    # Single pass over the lines - annotations are only picked up from the leading block of
+    # lines, status and uuid from anywhere after it
+    in_annotations = True
+    for line in lines:
+        match = _desc_field_re.match(line)
+        if match is None:
+            in_annotations = False
+            continue
+
+        field, value = match.group(1).lower(), match.group(2).strip()
+        if field == "annotation":
+            if in_annotations:
+                annotations.append(value)
+            continue
+
+        in_annotations = False
+        if field == "status":
+            status = value.lower()
         else:
-            break
-
-    if i == len(lines) - 1:
-        return annotations, status, uuid
-
-    # Iterate through rest of lines, find only the status and uuid ones
-    for line in lines[i:]:
-        parts = line.split(":", maxsplit=1)
-        if len(parts) == 2:
-            start = parts[0].lower()
-            if start.startswith("* status"):
-                status = parts[1].strip().lower()
-            elif start.startswith("* uuid"):
-                try:
-                    uuid = UUID(parts[1].strip())
-                except ValueError as err:
-                    logger.error(
-                        f'Invalid UUID "{err}" provided during GCal -> TW conversion,'
-                        f" Using None...\n\n{traceback.format_exc()}"
-                    )
+            try:
+                uuid = UUID(value)
+            except ValueError as err:
+                logger.error(
+                    f'Invalid UUID "{err}" provided during GCal -> TW conversion,'
+                    f" Using None...\n\n{traceback.format_exc()}"
+                )
 
     return annotations, status, uuid
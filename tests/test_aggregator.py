@@ -1,7 +1,14 @@
+import threading
 from typing import Optional, Sequence
+from unittest.mock import patch
 
+import pytest
+from bidict import bidict
+from bubop import pickle_dump
+from item_synchronizer.helpers import SideChanges
 from item_synchronizer.types import ID
 
+from syncall.aggregator import Aggregator
 from syncall.sync_side import ItemType, SyncSide
 
 
@@ -45,3 +52,152 @@ class MockSide(SyncSide):
         .. returns:: True if items are identical, False otherwise.
         """
         raise NotImplementedError("Implement in derived")
+
+
+class ItemsSide(MockSide):
+    """Side serving a fixed list of items - or raising the given error when fetching them."""
+
+    def __init__(
+        self, name: str, items: Sequence[ItemType] = (), error: Optional[Exception] = None
+    ) -> None:
+        super().__init__(name=name, fullname=name.capitalize())
+        self._items = items
+        self._error = error
+        self.fetched = threading.Event()
+
+    def get_all_items(self, **kargs) -> Sequence[ItemType]:
+        try:
+            if self._error is not None:
+                raise self._error
+            return self._items
+        finally:
+            self.fetched.set()
+
+    @classmethod
+    def id_key(cls) -> str:
+        return "id"
+
+    @classmethod
+    def summary_key(cls) -> str:
+        return "summary"
+
+    @classmethod
+    def last_modification_key(cls) -> str:
+        return "updated"
+
+    @classmethod
+    def items_are_identical(
+        cls, item1: ItemType, item2: ItemType, ignore_keys: Sequence[str] = []
+    ) -> bool:
+        keys = [k for k in ("id", "summary") if k not in ignore_keys]
+        return SyncSide._items_are_identical(item1, item2, keys=keys)
+
+
+class BlockingSide(ItemsSide):
+    """Side whose fetching of items blocks until it's released."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name=name)
+        self.release = threading.Event()
+
+    def get_all_items(self, **kargs) -> Sequence[ItemType]:
+        self.release.wait(timeout=10)
+        return super().get_all_items(**kargs)
+
+
+@pytest.fixture()
+def prefs_manager(mock_prefs_manager, tmp_path):
+    mock_prefs_manager._config_dir = tmp_path
+    with patch("syncall.aggregator.PrefsManager", return_value=mock_prefs_manager):
+        yield mock_prefs_manager
+
+
+def _create_aggregator(side_A: SyncSide, side_B: SyncSide, **kargs) -> Aggregator:
+    return Aggregator(
+        side_A=side_A,
+        side_B=side_B,
+        converter_B_to_A=lambda item: item,
+        converter_A_to_B=lambda item: item,
+        **kargs,
+    )
+
+
+@pytest.mark.parametrize("concurrent_fetch", [False, True])
+def test_sync_propagates_fetch_error(prefs_manager, concurrent_fetch):
+    side_A = ItemsSide("a", error=RuntimeError("Failed to fetch items of A"))
+    side_B = ItemsSide("b")
+    aggregator = _create_aggregator(side_A, side_B, concurrent_fetch=concurrent_fetch)
+
+    with pytest.raises(RuntimeError, match="Failed to fetch items of A"):
+        aggregator.sync()
+
+
+@pytest.mark.parametrize("concurrent_fetch", [False, True])
+def test_sync_propagates_fetch_error_of_side_B(prefs_manager, concurrent_fetch):
+    side_A = ItemsSide("a")
+    side_B = ItemsSide("b", error=RuntimeError("Failed to fetch items of B"))
+    aggregator = _create_aggregator(side_A, side_B, concurrent_fetch=concurrent_fetch)
+
+    with pytest.raises(RuntimeError, match="Failed to fetch items of B"):
+        aggregator.sync()
+
+
+def test_concurrent_fetch_error_of_side_B_abandons_side_A(prefs_manager):
+    side_A = BlockingSide("a")
+    side_B = ItemsSide("b", error=RuntimeError("Failed to fetch items of B"))
+    aggregator = _create_aggregator(side_A, side_B, concurrent_fetch=True)
+
+    try:
+        with pytest.raises(RuntimeError, match="Failed to fetch items of B"):
+            aggregator.sync()
+        assert not side_A.fetched.is_set()
+
+        # side A is still being fetched, on a thread that doesn't block the interpreter exit
+        (thread_A,) = [t for t in threading.enumerate() if t.name == "fetch-a"]
+        assert thread_A.daemon
+    finally:
+        side_A.release.set()
+
+
+def test_concurrent_fetch_detects_new_items(prefs_manager):
+    side_A = ItemsSide("a", items=[{"id": "a1", "summary": "first"}])
+    side_B = ItemsSide("b", items=[{"id": 1, "summary": "second"}])
+    aggregator = _create_aggregator(side_A, side_B, concurrent_fetch=True)
+
+    with patch.object(aggregator, "detect_changes", wraps=aggregator.detect_changes) as detect:
+        with patch.object(aggregator._synchronizer, "sync"), patch.object(
+            ItemsSide, "get_item", side_effect=lambda item_id: {"id": item_id}
+        ):
+            aggregator.sync()
+
+    (_, items_A), (_, items_B) = (call.args for call in detect.call_args_list)
+    assert list(items_A.keys()) == ["a1"]
+    assert list(items_B.keys()) == ["1"]
+
+
+def test_detect_changes(prefs_manager):
+    prefs_manager["b_a_ids"] = bidict(
+        {"b_unchanged": "a_unchanged", "b_modified": "a_modified", "b_deleted": "a_deleted"}
+    )
+    aggregator = _create_aggregator(ItemsSide("a"), ItemsSide("b"))
+
+    # cached versions of the items from the previous run
+    for side in ("a", "b"):
+        for suffix in ("unchanged", "modified"):
+            item_id = f"{side}_{suffix}"
+            serdes_dir = aggregator.config[f"{side}_serdes"]
+            pickle_dump({"id": item_id, "summary": suffix}, serdes_dir / item_id)
+
+    def fetched(side: str):
+        return {
+            f"{side}_new": {"id": f"{side}_new", "summary": "new"},
+            f"{side}_unchanged": {"id": f"{side}_unchanged", "summary": "unchanged"},
+            f"{side}_modified": {"id": f"{side}_modified", "summary": "modified - again"},
+        }
+
+    assert aggregator.detect_changes(aggregator._helper_A, fetched("a")) == SideChanges(
+        new={"a_new"}, modified={"a_modified"}, deleted={"a_deleted"}
+    )
+    assert aggregator.detect_changes(aggregator._helper_B, fetched("b")) == SideChanges(
+        new={"b_new"}, modified={"b_modified"}, deleted={"b_deleted"}
+    )
@@ -89,3 +89,15 @@ class TestConversions(GenericTestCase):
             ),
         )
         # can't really check the description field..
+
+    def test_gcal_tw_uuid_in_last_line(self):
+        """GCal -> TW conversion picks up a uuid placed in the last line of the description."""
+        self.load_sample_items()
+        gcal_item = self.gcal_item.copy()
+        gcal_item["description"] = (
+            "IMPORTED FROM TASKWARRIOR\n\n* Annotation 1: kalimera\n\n"
+            "* uuid: 00208973-20da-4988-ae3e-58ef3650c363"
+        )
+        tw_item_out = convert_gcal_to_tw(gcal_item)
+        self.assertEqual(tw_item_out["annotations"], ["kalimera"])
+        self.assertEqual(str(tw_item_out["uuid"]), "00208973-20da-4988-ae3e-58ef3650c363")